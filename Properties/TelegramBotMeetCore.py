@@ -16,7 +16,8 @@ def main_bot(token: str):
     """
     Main function to run the bot.
     """
-    application = Application.builder().token(token).build()
+    # Handle updates concurrently so replies share the HTTP connection pool
+    application = Application.builder().token(token).concurrent_updates(True).build()
     
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, reply_all_messages))
     